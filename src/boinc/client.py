@@ -21,17 +21,51 @@
 # Based on client/boinc_cmd.cpp
 
 
-from functools import total_ordering
+from functools import lru_cache, total_ordering
 import hashlib
+import logging
+import os
 import socket
+import sys
 import time
-from xml.etree import ElementTree
+
+try:
+    # lxml's C-backed parsing and iteration are noticeably faster on the
+    # larger RPC replies (get_results, get_host_info). The API subset used
+    # here (.tag, .text, iteration, fromstring) is identical to stdlib's.
+    from lxml import etree as ElementTree
+except ImportError:
+    import xml.etree.ElementTree as ElementTree
+
+    # Stdlib ElementTree swaps its hot paths for the _elementtree C
+    # accelerator on import; without it, parsing silently runs on the
+    # pure-Python implementation at a fraction of the speed. Worth a
+    # breadcrumb in the logs if that ever happens (e.g. a trimmed-down
+    # interpreter build).
+    try:
+        import _elementtree  # noqa: F401
+    except ImportError:
+        logging.getLogger(__name__).debug(
+            "_elementtree C accelerator not available; "
+            "XML parsing will be slow"
+        )
+
+# lxml elements are instances of _Element, not of the Element factory.
+_Element = getattr(ElementTree, "_Element", ElementTree.Element)
 
 import rpc
 
 
+_log = logging.getLogger(__name__)
+
 GUI_RPC_PASSWD_FILE = "/etc/boinc-client/gui_rpc_auth.cfg"
 
+# The two get_results requests, pre-encoded once; indexed by active_only.
+_GET_RESULTS = (
+    b"<get_results><active_only>0</active_only></get_results>",
+    b"<get_results><active_only>1</active_only></get_results>",
+)
+
 
 def setattrs_from_xml(obj, xml, attrfuncdict={}):
     """
@@ -41,29 +75,27 @@ def setattrs_from_xml(obj, xml, attrfuncdict={}):
     each attribute. It falls back to simple int/float/bool/str detection
     based on values defined in __init__(). This would not be needed if
     Boinc used standard RPC protocol, which includes data type in XML.
+    For _Struct subclasses (and no attrfuncdict) the per-tag converters
+    are resolved from a dispatch table generated once at class definition,
+    instead of re-doing the hasattr/getattr/isinstance dance per tag.
     """
-    if not isinstance(xml, ElementTree.Element):
+    if not isinstance(xml, _Element):
         xml = ElementTree.fromstring(xml)
-    for e in list(xml):
+    if not attrfuncdict and isinstance(obj, _Struct):
+        return type(obj)._parse_into(obj, xml)
+    # Elements are directly iterable; list(xml) would allocate a
+    # throwaway copy of the child list.
+    for e in xml:
         if hasattr(obj, e.tag):
             attr = getattr(obj, e.tag)
             attrfunc = attrfuncdict.get(e.tag, None)
             if attrfunc is None:
-                if isinstance(attr, bool):
-                    attrfunc = parse_bool
-                elif isinstance(attr, int):
-                    attrfunc = parse_int
-                elif isinstance(attr, float):
-                    attrfunc = parse_float
-                elif isinstance(attr, str):
-                    attrfunc = parse_str
-                elif isinstance(attr, list):
-                    attrfunc = parse_list
-                else:
-                    attrfunc = lambda x: x
+                attrfunc = _TYPE_PARSER.get(type(attr), parse_raw)
             setattr(obj, e.tag, attrfunc(e))
         else:
-            print("class missing attribute '%s': %r" % (e.tag, obj))
+            # Lazy % formatting: repr(obj) walks every attribute, so
+            # only build it if a DEBUG handler will actually see it.
+            _log.debug("class missing attribute %r: %r", e.tag, obj)
     return obj
 
 
@@ -97,6 +129,25 @@ def parse_str(e):
     return "" if e.text is None else e.text.strip()
 
 
+def iter_elements(stream, tag):
+    """
+    Helper to yield each element named 'tag' from a streamed RPC reply as
+    its end tag closes, clearing parsed content as it goes. Keeps peak
+    memory at a single record instead of the whole reply, and avoids a
+    second traversal of a fully built tree.
+    """
+    for _event, elem in ElementTree.iterparse(stream, events=("end",)):
+        if elem.tag != tag:
+            continue
+        yield elem
+        elem.clear()
+        # lxml keeps consumed siblings alive through the parent;
+        # drop them so memory is released per record.
+        if hasattr(elem, "getprevious"):
+            while elem.getprevious() is not None:
+                del elem.getparent()[0]
+
+
 def parse_list(e):
     """
     Helper to convert ElementTree.Element to list. For now, simply return
@@ -105,25 +156,59 @@ def parse_list(e):
     return list(e)
 
 
+def parse_raw(e):
+    """Fallback converter: keep the Element itself (attribute had no
+    recognizable default type to map from)."""
+    return e
+
+
+# Converter for each supported default-value type, resolved once when a
+# dispatch table is built rather than via an isinstance chain per tag.
+_TYPE_PARSER = {
+    bool: parse_bool,
+    int: parse_int,
+    float: parse_float,
+    str: parse_str,
+    list: parse_list,
+}
+
+
 class Enum(object):
     UNKNOWN = -1  # not in original API.
 
+    # Name of the UNKNOWN value, and fallback for values not found.
+    _NAMES = {UNKNOWN: "unknown"}
+
+    # Per-subclass display names for values whose derived name (the
+    # attribute name, lowercased) does not match what the original API
+    # prints. Merged over the derived names at class definition.
+    _NAME_OVERRIDES = {}
+
+    def __init_subclass__(cls, **kwargs):
+        super().__init_subclass__(**kwargs)
+        names = dict(cls._NAMES)  # inherit parent names (e.g. UNKNOWN)
+        names.update(
+            (v, k.lower().replace("_", " "))
+            for k, v in vars(cls).items()
+            if isinstance(v, int) and not k.startswith("_")
+        )
+        names.update(cls._NAME_OVERRIDES)
+        cls._NAMES = names
+
     @classmethod
     def name(cls, value):
-        """Quick-and-dirty fallback for getting the "name" of an enum item."""
+        """
+        Get the "name" of an enum item: a single lookup in the _NAMES
+        table built at class definition, instead of a linear scan of the
+        class dict per call.
+        """
 
         # Value as string, if it matches an enum attribute.
         # Allows short usage as Enum.name("VALUE") besides Enum.name(Enum.VALUE).
         if hasattr(cls, str(value)):
-            return cls.name(getattr(cls, value, None))
-
-        # Value not handled in subclass name().
-        for k, v in cls.__dict__.items():
-            if v == value:
-                return k.lower().replace("_", " ")
+            value = getattr(cls, value, None)
 
-        # Value not found.
-        return cls.name(Enum.UNKNOWN)
+        return cls._NAMES.get(value, cls._NAMES[cls.UNKNOWN])
 
 
 class NetworkStatus(Enum):
@@ -134,20 +219,12 @@ class NetworkStatus(Enum):
     WANT_DISCONNECT = 2  # do not have any connections, and do not need any
     LOOKUP_PENDING = 3  # a website lookup is pending (try again later)
 
-    @classmethod
-    def name(cls, v):
-        if v == cls.UNKNOWN:
-            return "unknown"
-        elif v == cls.ONLINE:
-            return "up"  # 'online' is misleading, but is 'up' better?
-        elif v == cls.WANT_CONNECTION:
-            return "need connection"
-        elif v == cls.WANT_DISCONNECT:
-            return "do not need connection"
-        elif v == cls.LOOKUP_PENDING:
-            return "reference site lookup pending"
-        else:
-            return super(NetworkStatus, cls).name(v)
+    _NAME_OVERRIDES = {
+        ONLINE: "up",  # 'online' is misleading, but is 'up' better?
+        WANT_CONNECTION: "need connection",
+        WANT_DISCONNECT: "do not need connection",
+        LOOKUP_PENDING: "reference site lookup pending",
+    }
 
 
 class SuspendReason(Enum):
@@ -174,42 +251,22 @@ class SuspendReason(Enum):
     BATTERY_CHARGING = 4098
     BATTERY_OVERHEATED = 4099
 
-    @classmethod
-    def name(cls, v):
-        if v == cls.UNKNOWN:
-            return "unknown reason"
-        elif v == cls.BATTERIES:
-            return "on batteries"
-        elif v == cls.USER_ACTIVE:
-            return "computer is in use"
-        elif v == cls.USER_REQ:
-            return "user request"
-        elif v == cls.TIME_OF_DAY:
-            return "time of day"
-        elif v == cls.BENCHMARKS:
-            return "CPU benchmarks in progress"
-        elif v == cls.DISK_SIZE:
-            return "need disk space - check preferences"
-        elif v == cls.NO_RECENT_INPUT:
-            return "no recent user activity"
-        elif v == cls.INITIAL_DELAY:
-            return "initial delay"
-        elif v == cls.EXCLUSIVE_APP_RUNNING:
-            return "an exclusive app is running"
-        elif v == cls.CPU_USAGE:
-            return "CPU is busy"
-        elif v == cls.NETWORK_QUOTA_EXCEEDED:
-            return "network bandwidth limit exceeded"
-        elif v == cls.OS:
-            return "requested by operating system"
-        elif v == cls.WIFI_STATE:
-            return "not connected to WiFi network"
-        elif v == cls.BATTERY_CHARGING:
-            return "battery is recharging"
-        elif v == cls.BATTERY_OVERHEATED:
-            return "battery is overheated"
-        else:
-            return super(SuspendReason, cls).name(v)
+    _NAME_OVERRIDES = {
+        Enum.UNKNOWN: "unknown reason",
+        BATTERIES: "on batteries",
+        USER_ACTIVE: "computer is in use",
+        USER_REQ: "user request",
+        BENCHMARKS: "CPU benchmarks in progress",
+        DISK_SIZE: "need disk space - check preferences",
+        NO_RECENT_INPUT: "no recent user activity",
+        EXCLUSIVE_APP_RUNNING: "an exclusive app is running",
+        CPU_USAGE: "CPU is busy",
+        NETWORK_QUOTA_EXCEEDED: "network bandwidth limit exceeded",
+        OS: "requested by operating system",
+        WIFI_STATE: "not connected to WiFi network",
+        BATTERY_CHARGING: "battery is recharging",
+        BATTERY_OVERHEATED: "battery is overheated",
+    }
 
 
 class RunMode(Enum):
@@ -223,13 +280,33 @@ class RunMode(Enum):
     NEVER = 3
     RESTORE = 4 # restore permanent mode - used only in set_X_mode() GUI RPC
 
-    @classmethod
-    def name(cls, v):
-        # All other modes use the fallback name.
-        if v == cls.AUTO:
-            return "according to preferences"
-        else:
-            return super(RunMode, cls).name(v)
+    # All other modes use the derived name.
+    _NAME_OVERRIDES = {AUTO: "according to preferences"}
+
+
+# XML tag for each RunMode in set_{run,gpu,network}_mode requests,
+# materialized once so the RPC path does no name lookup or lowercasing.
+_RUNMODE_XML = {
+    RunMode.ALWAYS: "always",
+    RunMode.AUTO: "auto",
+    RunMode.NEVER: "never",
+    RunMode.RESTORE: "restore",
+}
+
+# Request templates for set_{run,gpu,network}_mode, one per accepted
+# (component, mode) pair including the 'cpu'/'net' aliases, so the call
+# path only fills in the duration instead of re-formatting and
+# re-aliasing the whole request every time.
+_SET_MODE_TEMPLATES = {
+    (alias, mode):
+        "<set_%s_mode><%s/><duration>{dur:f}</duration></set_%s_mode>"
+        % (component, tag, component)
+    for alias, component in (
+        ("run", "run"), ("cpu", "run"), ("gpu", "gpu"),
+        ("network", "network"), ("net", "network"),
+    )
+    for mode, tag in _RUNMODE_XML.items()
+}
 
 
 class CpuSched(Enum):
@@ -282,36 +359,146 @@ class _Struct(object):
     """
     Base helper class with common methods for all classes derived from
     BOINC's C++ structs.
+    Each subclass gets a parser dispatch table generated at class
+    definition time: every attribute assigned in __init__() is mapped,
+    by the type of its default value, to one of the parse_*() helpers.
+    Parsing then costs a single dict lookup per tag instead of the
+    hasattr/getattr/isinstance chain in the hot loop.
     """
 
+    # Instances are created in tight loops (get_results builds hundreds
+    # per poll), so subclasses declare __slots__ to store their ~dozens
+    # of scalar attributes in a fixed array instead of a per-instance
+    # dict: smaller objects, faster attribute access.
+    __slots__ = ()
+
+    # Per-subclass converter overrides, merged over the generated table.
+    # Same role as setattrs_from_xml()'s attrfuncdict, resolved once.
+    _TAG_OVERRIDES = {}
+
+    # Tags whose children are parsed into the *same* object instead of
+    # producing a value: converters take (obj, element), not (element).
+    # Consulted only on a dispatch miss, so scalar tags pay nothing.
+    _TAG_STRUCTURAL = {}
+
+    def __init_subclass__(cls, **kwargs):
+        super().__init_subclass__(**kwargs)
+        fields = []
+        for klass in reversed(cls.__mro__):
+            fields.extend(getattr(klass, "__slots__", ()))
+        cls._FIELDS = tuple(fields)
+        sentinel = cls()
+        defaults = {name: getattr(sentinel, name) for name in fields}
+        # Interned keys make the per-tag dict probes identity hits for
+        # the parser-produced tag strings (which CPython also interns).
+        dispatch = {
+            sys.intern(name): _TYPE_PARSER.get(type(value), parse_raw)
+            for name, value in defaults.items()
+        }
+        dispatch.update(
+            (sys.intern(name), attrfunc)
+            for name, attrfunc in cls._TAG_OVERRIDES.items()
+        )
+        cls._TAG_STRUCTURAL = {
+            sys.intern(name): attrfunc
+            for name, attrfunc in cls._TAG_STRUCTURAL.items()
+        }
+        # A structural tag may share its name with a plain field (e.g.
+        # Result.active_task); the structural converter takes precedence.
+        for name in cls._TAG_STRUCTURAL:
+            dispatch.pop(name, None)
+        cls._TAG_DISPATCH = dispatch
+        # Unrecognized tags already logged, so new-client additions are
+        # reported once per class rather than once per record parsed.
+        cls._UNKNOWN_TAGS = set()
+        cls._DEFAULTS = defaults
+        cls._LIST_FIELDS = tuple(
+            name for name, value in defaults.items()
+            if isinstance(value, list)
+        )
+
     @classmethod
     def parse(cls, xml):
-        return setattrs_from_xml(cls(), xml)
+        """
+        Parse either XML text or an already-built Element. The string
+        coercion happens here, once, at the outermost entry point.
+        """
+        if not isinstance(xml, _Element):
+            xml = ElementTree.fromstring(xml)
+        return cls._parse_element(xml)
+
+    @classmethod
+    def _parse_element(cls, elem):
+        """
+        Element-only fast path, for internal loops that already hold
+        Element instances (no isinstance re-check per record).
+        """
+        return cls._parse_into(cls._new_blank(), elem)
+
+    @classmethod
+    def _new_blank(cls):
+        """
+        Construct an instance without running __init__(): defaults are
+        applied in a single __dict__.update() from the class-level
+        snapshot instead of dozens of individual assignments, most of
+        which the XML values would immediately overwrite anyway.
+        """
+        obj = cls.__new__(cls)
+        for name, value in cls._DEFAULTS.items():
+            setattr(obj, name, value)
+        # Lists are mutable; each instance needs its own copy.
+        for name in cls._LIST_FIELDS:
+            setattr(obj, name, list(cls._DEFAULTS[name]))
+        return obj
+
+    @classmethod
+    def _parse_into(cls, obj, xml):
+        """
+        Populate obj from an Element via the generated dispatch table.
+        """
+        dispatch = cls._TAG_DISPATCH
+        structural = cls._TAG_STRUCTURAL
+        for e in xml:
+            attrfunc = dispatch.get(e.tag)
+            if attrfunc is not None:
+                setattr(obj, e.tag, attrfunc(e))
+            elif e.tag in structural:
+                structural[e.tag](obj, e)
+            elif e.tag not in cls._UNKNOWN_TAGS:
+                cls._UNKNOWN_TAGS.add(e.tag)
+                _log.debug("class missing attribute %r: %r", e.tag, obj)
+        return obj
 
     def __str__(self, indent=0):
-        buf = '%s%s:\n' % ('\t' * indent, self.__class__.__name__)
-        for attr in self.__dict__:
+        # Collect parts and join once at the end: repeated '+=' on an
+        # ever-growing string is O(n) per append, O(n^2) over Result's
+        # ~50 fields.
+        pad = '\t' * indent
+        parts = ['%s%s:\n' % (pad, self.__class__.__name__)]
+        for attr in self._FIELDS:
             value = getattr(self, attr)
             if isinstance(value, list):
-                buf += '%s\t%s [\n' % ('\t' * indent, attr)
+                parts.append('%s\t%s [\n' % (pad, attr))
                 for v in value:
-                    buf += '\t\t%s\t\t,\n' % v
-                buf += '\t]\n'
+                    parts.append('\t\t%s\t\t,\n' % v)
+                parts.append('\t]\n')
             else:
-                buf += '%s\t%s\t%s\n' % (
-                    '\t' * indent,
+                parts.append('%s\t%s\t%s\n' % (
+                    pad,
                     attr,
                     (
                         value.__str__(indent + 2)
                         if isinstance(value, _Struct)
                         else repr(value)
                     ),
-                )
-        return buf
+                ))
+        return ''.join(parts)
 
 
 @total_ordering
 class VersionInfo(_Struct):
+    __slots__ = ('major', 'minor', 'release')
+
     def __init__(self, major=0, minor=0, release=0):
         self.major = major
         self.minor = minor
@@ -340,6 +527,15 @@ class VersionInfo(_Struct):
 
 
 class CcStatus(_Struct):
+    __slots__ = (
+        'network_status', 'ams_password_error', 'manager_must_quit',
+        'task_suspend_reason', 'task_mode', 'task_mode_perm',
+        'task_mode_delay', 'network_suspend_reason', 'network_mode',
+        'network_mode_perm', 'network_mode_delay',
+        'gpu_suspend_reason', 'gpu_mode', 'gpu_mode_perm',
+        'gpu_mode_delay', 'disallow_attach', 'simple_gui_only',
+    )
+
     def __init__(self):
         self.network_status = NetworkStatus.UNKNOWN
         self.ams_password_error = False
@@ -365,6 +561,23 @@ class CcStatus(_Struct):
 
 
 class HostInfo(_Struct):
+    __slots__ = (
+        'timezone', 'domain_name', 'ip_addr', 'host_cpid',
+        'p_ncpus', 'p_vendor', 'p_model', 'p_features', 'p_fpops',
+        'p_iops', 'p_membw', 'p_calculated',
+        'p_vm_extensions_disabled', 'm_nbytes', 'm_cache', 'm_swap',
+        'd_total', 'd_free', 'os_name', 'os_version',
+        'virtualbox_version', 'product_name', 'wsl_available',
+        'coprocs', 'n_usable_coprocs', 'serialnum',
+    )
+
+    # Parse each coproc in the same pass as the rest of the struct,
+    # instead of materializing an Element list and re-walking it after.
+    # (Coproc is defined below; the lambda resolves it at parse time.)
+    _TAG_OVERRIDES = {
+        "coprocs": lambda e: [Coproc._parse_element(c) for c in e],
+    }
+
     def __init__(self):
         self.timezone = 0  # local STANDARD time - UTC time (in seconds)
         self.domain_name = ""
@@ -407,22 +620,6 @@ class HostInfo(_Struct):
         # The following are currently unused (not in RPC XML).
         self.serialnum = ""  # textual description of coprocessors
 
-    @classmethod
-    def parse(cls, xml):
-        if not isinstance(xml, ElementTree.Element):
-            xml = ElementTree.fromstring(xml)
-
-        # Parse main XML.
-        hostinfo = super(HostInfo, cls).parse(xml)
-
-        # Parse each coproc in coprocs list.
-        aux = []
-        for c in hostinfo.coprocs:
-            aux.append(Coproc.parse(c))
-        hostinfo.coprocs = aux
-
-        return hostinfo
-
 
 class Coproc(_Struct):
     """
@@ -432,6 +629,13 @@ class Coproc(_Struct):
     Used in both client and server.
     """
 
+    __slots__ = (
+        'type', 'count', 'peak_flops', 'used', 'have_cuda',
+        'have_cal', 'have_opencl', 'available_ram',
+        'specified_in_config', 'req_secs', 'req_instances',
+        'estimated_delay', 'opencl_device_count', 'last_print_time',
+    )
+
     def __init__(self):
         self.type = ""  # must be unique
         self.count = 0  # how many are present
@@ -459,6 +663,24 @@ class Coproc(_Struct):
 
 
 class Project(_Struct):
+    __slots__ = (
+        'master_url', 'project_name', 'symstore', 'user_name',
+        'team_name', 'host_venue', 'email_hash', 'cross_project_id',
+        'external_cpid', 'cpid_time', 'user_total_credit',
+        'user_expavg_credit', 'user_create_time', 'rpc_seqno',
+        'userid', 'teamid', 'hostid', 'host_total_credit',
+        'host_expavg_credit', 'host_create_time', 'min_rpc_time',
+        'next_rpc_time', 'nrpc_failures', 'master_fetch_failures',
+        'rec', 'rec_time', 'resource_share', 'desired_disk_usage',
+        'duration_correction_factor', 'sched_rpc_pending',
+        'send_time_stats_log', 'send_job_log', 'njobs_success',
+        'njobs_error', 'elapsed_time', 'last_rpc_time',
+        'dont_use_dcf', 'rsc_backoff_time', 'rsc_backoff_interval',
+        'dont_request_more_work', 'verify_files_on_app_start',
+        'gui_urls', 'sched_priority',
+        'project_files_downloaded_time', 'project_dir', 'venue',
+    )
+
     def __init__(self):
         self.master_url = ""
         self.project_name = ""
@@ -525,29 +747,49 @@ class Project(_Struct):
 
         self.venue = None
 
-    @classmethod
-    def parse(cls, xml):
-        if not isinstance(xml, ElementTree.Element):
-            xml = ElementTree.fromstring(xml)
-
-        # Parse main XML.
-        result = super(Project, cls).parse(xml)
-
-        return result
-
     def __str__(self):
-        buf = '%s:\n' % self.__class__.__name__
-        for attr in self.__dict__:
+        parts = ['%s:\n' % self.__class__.__name__]
+        for attr in self._FIELDS:
             value = getattr(self, attr)
             if attr in ["rec_time", "user_create_time", "host_create_time"]:
                 value = time.ctime(value)
-            buf += '\t%s\t%r\n' % (attr, value)
-        return buf
+            parts.append('\t%s\t%r\n' % (attr, value))
+        return ''.join(parts)
 
 
 class Result(_Struct):
     """Also called "task" in some contexts."""
 
+    __slots__ = (
+        'name', 'wu_name', 'version_num', 'plan_class',
+        'project_url', 'report_deadline', 'received_time',
+        'ready_to_report', 'got_server_ack', 'final_cpu_time',
+        'final_elapsed_time', 'state',
+        'estimated_cpu_time_remaining', 'exit_status',
+        'suspended_via_gui', 'project_suspended_via_gui',
+        'edf_scheduled', 'coproc_missing', 'scheduler_wait',
+        'scheduler_wait_reason', 'network_wait', 'resources',
+        'active_task', 'active_task_state', 'app_version_num',
+        'slot', 'pid', 'scheduler_state', 'checkpoint_cpu_time',
+        'current_cpu_time', 'fraction_done', 'elapsed_time',
+        'swap_size', 'working_set_size_smoothed', 'too_large',
+        'needs_shmem', 'graphics_exec_path', 'web_graphics_url',
+        'remote_desktop_addr', 'slot_path', 'completed_time',
+        'report_immediately', 'working_set_size', 'page_fault_rate',
+        'signal', 'app', 'wup', 'project', 'avp', 'progress_rate',
+        'platform', 'bytes_sent', 'bytes_received',
+    )
+
+    # '<active_task>' wraps the per-task runtime fields; parse its
+    # children straight into the same Result, in the main loop, instead
+    # of re-scanning the element with find() afterwards.
+    _TAG_STRUCTURAL = {
+        "active_task": lambda obj, e: (
+            setattr(obj, "active_task", True),
+            type(obj)._parse_into(obj, e),
+        ),
+    }
+
     def __init__(self):
         # Names and values follow lib/gui_rpc_client.h @ RESULT
         # Order too, except when grouping contradicts client/result.cpp
@@ -622,20 +864,9 @@ class Result(_Struct):
         self.bytes_received = None
 
     @classmethod
-    def parse(cls, xml):
-        if not isinstance(xml, ElementTree.Element):
-            xml = ElementTree.fromstring(xml)
-
-        # Parse main XML.
-        result = super(Result, cls).parse(xml)
-
-        # Parse '<active_task>' children.
-        active_task = xml.find("active_task")
-        if active_task is None:
-            result.active_task = False  # already the default after __init__()
-        else:
-            result.active_task = True  # already the default after main parse
-            result = setattrs_from_xml(result, active_task)
+    def _parse_element(cls, elem):
+        # '<active_task>' children are handled by _TAG_STRUCTURAL above.
+        result = super(Result, cls)._parse_element(elem)
 
         # If CPU time is nonzero but elapsed time is zero, then must be talking
         # to an old client (easier to deal with this here than in the manager).
@@ -648,13 +879,13 @@ class Result(_Struct):
         return result
 
     def __str__(self):
-        buf = '%s:\n' % self.__class__.__name__
-        for attr in self.__dict__:
+        parts = ['%s:\n' % self.__class__.__name__]
+        for attr in self._FIELDS:
             value = getattr(self, attr)
             if attr in ["received_time", "report_deadline"]:
                 value = time.ctime(value)
-            buf += '\t%s\t%r\n' % (attr, value)
-        return buf
+            parts.append('\t%s\t%r\n' % (attr, value))
+        return ''.join(parts)
 
 
 class BoincClient(object):
@@ -664,6 +895,8 @@ class BoincClient(object):
         self.hostname = host[0]
         self.port = int(host[1]) if len(host) == 2 else 0
         self.passwd = passwd
+        # Pre-encoded for authorize(), which may run on every reconnect.
+        self._passwd_bytes = None if passwd is None else passwd.encode("utf-8")
         self.rpc = rpc.Rpc(text_output=False)
         self.version = None
         self.authorized = False
@@ -693,6 +926,34 @@ class BoincClient(object):
     def disconnect(self):
         self.rpc.disconnect()
 
+    def _ensure_connected(self):
+        """
+        Make sure the connection is usable before an RPC, reusing it
+        whenever possible: a full connect() re-does authorization and
+        version exchange, which is wasteful on every poll. A zero-byte
+        MSG_PEEK probe detects a peer that actually closed the socket;
+        a probe that would block means the connection is idle and alive.
+        """
+        sock = self.rpc.sock
+        if sock is None or not self.connected:
+            self.connect()
+            return
+        timeout = sock.gettimeout()
+        sock.settimeout(0)
+        try:
+            alive = bool(sock.recv(1, socket.MSG_PEEK))
+        except (BlockingIOError, InterruptedError):
+            return  # nothing pending to read: peer is still there
+        except socket.error:
+            alive = False
+        finally:
+            sock.settimeout(timeout)
+        if not alive:
+            # Peer closed the connection: only now pay for a full
+            # reconnect and re-authorization.
+            self.connected = False
+            self.connect()
+
     def authorize(self, password):
         """
         Request authorization. If password is None and we are connecting
@@ -706,11 +967,18 @@ class BoincClient(object):
         """
         if password is None and not self.hostname:
             password = read_gui_rpc_password() or ""
+        if password is self.passwd and self._passwd_bytes is not None:
+            passwd_bytes = self._passwd_bytes
+        else:
+            passwd_bytes = ("" if password is None else password).encode("utf-8")
         nonce = self.rpc.call("<auth1/>").text
-        inputStr = "%s%s" % (nonce, password)
-        hash = hashlib.md5(inputStr.encode("utf-8")).hexdigest().lower()
+        # Feed the hasher incrementally: no nonce+password temporary, and
+        # hexdigest() is already lowercase.
+        hasher = hashlib.md5()
+        hasher.update(str(nonce).encode("utf-8"))
+        hasher.update(passwd_bytes)
         reply = self.rpc.call(
-            "<auth2><nonce_hash>%s</nonce_hash></auth2>" % hash
+            "<auth2><nonce_hash>%s</nonce_hash></auth2>" % hasher.hexdigest()
         )
 
         if reply.tag == "authorized":
@@ -731,8 +999,7 @@ class BoincClient(object):
         Return CcStatus instance containing basic status, such as
         CPU / GPU / Network active/suspended, etc..
         """
-        if not self.connected:
-            self.connect()
+        self._ensure_connected()
         try:
             return CcStatus.parse(self.rpc.call("<get_cc_status/>"))
         except socket.error:
@@ -744,6 +1011,7 @@ class BoincClient(object):
 
     def get_host_info(self):
         """Get information about host hardware and usage."""
+        self._ensure_connected()
         return HostInfo.parse(self.rpc.call("<get_host_info/>"))
 
     @property
@@ -771,32 +1039,51 @@ class BoincClient(object):
         static state;
         if it is not there, call get_state() again.
         """
-        reply = self.rpc.call(
-            "<get_results><active_only>%d</active_only></get_results>"
-            % (1 if active_only else 0)
-        )
-        if not reply.tag == "results":
-            return []
+        self._ensure_connected()
+        stream = self.rpc.call_stream(_GET_RESULTS[1 if active_only else 0])
 
         results = []
-        for item in list(reply):
-            results.append(Result.parse(item))
+        for item in iter_elements(stream, "result"):
+            results.append(Result._parse_element(item))
 
         return results
 
+    def poll_all(self, active_only=True):
+        """
+        Fetch basic status, host info and tasks in a single pipelined
+        round-trip, instead of the three it takes calling get_cc_status(),
+        get_host_info() and get_results() in sequence.
+        Return a (CcStatus, HostInfo, list of Result) tuple.
+        This method is not part of the original API.
+        """
+        self._ensure_connected()
+        try:
+            status, host, results = self.rpc.call_batch((
+                "<get_cc_status/>",
+                "<get_host_info/>",
+                _GET_RESULTS[1 if active_only else 0],
+            ))
+        except socket.error:
+            self.connected = False
+            raise
+
+        return (
+            CcStatus._parse_element(status),
+            HostInfo._parse_element(host),
+            [Result._parse_element(e) for e in results.iter("result")],
+        )
+
     @property
     def projects(self):
         return self.get_projects()
 
     def get_projects(self):
-        reply = self.rpc.call("<get_project_status/>")
-
-        if not reply or not reply.tag == "projects":
-            return []
+        self._ensure_connected()
+        stream = self.rpc.call_stream("<get_project_status/>")
 
         projects = []
-        for item in list(reply):
-            projects.append(Project.parse(item))
+        for item in iter_elements(stream, "project"):
+            projects.append(Project._parse_element(item))
 
         return projects
 
@@ -806,15 +1093,15 @@ class BoincClient(object):
         This method is not part of the original API.
         Valid components are 'run' (or 'cpu'), 'gpu', 'network' (or 'net').
         """
-        component = component.replace("cpu", "run")
-        component = component.replace("net", "network")
         try:
-            reply = self.rpc.call(
-                "<set_%s_mode>"
-                "<%s/><duration>%f</duration>"
-                "</set_%s_mode>"
-                % (component, RunMode.name(mode).lower(), duration, component)
+            request = _SET_MODE_TEMPLATES[(component, mode)]
+        except KeyError:
+            raise ValueError(
+                "invalid component or run mode: %r, %r" % (component, mode)
             )
+        self._ensure_connected()
+        try:
+            reply = self.rpc.call(request.format(dur=duration))
             return reply.tag == "success"
         except socket.error:
             return False
@@ -852,18 +1139,26 @@ class BoincClient(object):
         return False
 
 
+@lru_cache(maxsize=4)
+def _read_gui_rpc_password_file(path, mtime_ns):
+    """
+    Cached reader for read_gui_rpc_password(). Keyed on the file's mtime,
+    so edits to the file invalidate the entry on the next call.
+    """
+    with open(path, "r") as f:
+        return f.read().rstrip("\n")  # trim trailing CR
+
+
 def read_gui_rpc_password():
     """
     Read password string from GUI_RPC_PASSWD_FILE file, trim the last CR
-    (if any), and return the password.
+    (if any), and return the password. Contents are cached across calls:
+    a manager re-authorizing on every reconnect should not re-read the
+    file each time, a stat() is enough to notice changes.
     """
     try:
-        with open(GUI_RPC_PASSWD_FILE, "r") as f:
-            buf = f.read()
-            if buf.endswith("\n"):
-                return buf[:-1]  # trim last CR
-            else:
-                return buf
+        mtime_ns = os.stat(GUI_RPC_PASSWD_FILE).st_mtime_ns
+        return _read_gui_rpc_password_file(GUI_RPC_PASSWD_FILE, mtime_ns)
     except IOError:
         # Permission denied or File not found.
         pass
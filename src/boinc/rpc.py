@@ -22,7 +22,19 @@
 
 
 import socket
-from xml.etree import ElementTree
+
+try:
+    # Prefer lxml's C-backed parser when available; the API subset used
+    # here (fromstring, tostring, Element) matches stdlib's.
+    from lxml import etree as ElementTree
+except ImportError:
+    # Stdlib ElementTree is only fast when its _elementtree C
+    # accelerator is importable; otherwise fromstring()/tostring() run
+    # on the pure-Python implementation (client.py logs that case).
+    import xml.etree.ElementTree as ElementTree
+
+# lxml elements are instances of _Element, not of the Element factory.
+_Element = getattr(ElementTree, "_Element", ElementTree.Element)
 
 
 GUI_RPC_HOSTNAME = None  # localhost
@@ -30,6 +42,37 @@ GUI_RPC_PORT = 31416
 GUI_RPC_TIMEOUT = 10
 
 
+class _ReplyStream(object):
+    """
+    File-like reader for a single RPC reply, ending at the '\\003' message
+    terminator. Suitable for ElementTree.iterparse(), which pulls the
+    reply in chunks instead of requiring it whole in memory.
+    The stream must be read to exhaustion before the next RPC call.
+    """
+
+    def __init__(self, rpc):
+        self.rpc = rpc
+        self.eof = False
+
+    def read(self, size=8192):
+        if self.eof:
+            return b""
+        rpc = self.rpc
+        if rpc._rbuf:
+            # Bytes already received past a previous reply's terminator.
+            buf, rpc._rbuf = rpc._rbuf, b""
+        else:
+            buf = rpc.sock.recv(min(size, 8192) if size > 0 else 8192)
+            if not buf:
+                raise socket.error("No data from socket")
+        n = buf.find(b'\003')
+        if not n == -1:
+            self.eof = True
+            rpc._rbuf = buf[n + 1:]
+            buf = buf[:n]
+        return buf
+
+
 class Rpc(object):
     """
     Class to perform GUI RPC calls to a BOINC core client.
@@ -45,6 +88,10 @@ class Rpc(object):
         self.sock = None
         self.text_output = text_output
 
+        # Received bytes past the last reply terminator, kept for the
+        # next read. Non-empty only when requests are pipelined.
+        self._rbuf = b""
+
     @property
     def sockargs(self):
         return (self.hostname, self.port, self.timeout)
@@ -73,56 +120,60 @@ class Rpc(object):
         self.sock = socket.create_connection(
             self.sockargs[0:2], self.sockargs[2]
         )
+        self._rbuf = b""
 
     def disconnect(self):
         """Disconnect from host. Calling multiple times is OK (idempotent)"""
         if self.sock:
             self.sock.close()
             self.sock = None
+        self._rbuf = b""
 
-    def call(self, request, text_output=None):
-        """
-        Do an RPC call. Pack and send the XML request and return the
-        unpacked reply. request can be either plain XML text or a
-        xml.etree.ElementTree.Element object. Return ElementTree.Element
-        or XML text according to text_output flag.
-        Will auto-connect if not connected.
-        """
-        if text_output is None:
-            text_output = self.text_output
-
-        if not self.sock:
-            self.connect(*self.sockargs)
-
-        if not isinstance(request, ElementTree.Element):
+    @staticmethod
+    def _pack_request(request):
+        """Enclose a request (XML text or Element) in GUI RPC framing."""
+        if not isinstance(request, _Element):
             request = ElementTree.fromstring(request)
 
-        # Pack request.
-        end = b'\003'
-        req = b"<boinc_gui_rpc_request>\n%s\n</boinc_gui_rpc_request>\n%s" % (
+        return b"<boinc_gui_rpc_request>\n%s\n</boinc_gui_rpc_request>\n%s" % (
             ElementTree.tostring(request).replace(b' />', b'/>'),
-            end,
+            b'\003',
         )
 
+    def send_request(self, request):
+        """
+        Pack and send an XML request, auto-connecting if not connected.
+        request can be either plain XML text or an ElementTree.Element.
+        The reply is left unread on the socket.
+        """
+        if not self.sock:
+            self.connect(*self.sockargs)
+
         try:
-            self.sock.sendall(req)
+            self.sock.sendall(self._pack_request(request))
         except (socket.error, socket.herror, socket.gaierror, socket.timeout):
             raise
 
-        req = b""
+    def _recv_reply(self):
+        """
+        Read one raw reply, up to the '\\003' terminator. Bytes received
+        past the terminator belong to the next pipelined reply and stay
+        buffered for the next read.
+        """
+        end = b'\003'
+        buf = self._rbuf
         while True:
-            try:
-                buf = self.sock.recv(8192)
-                if not buf:
-                    raise socket.error("No data from socket")
-            except socket.error:
-                raise
             n = buf.find(end)
             if not n == -1:
-                break
-            req += buf
-        req += buf[:n]
-
+                self._rbuf = buf[n + 1:]
+                return buf[:n]
+            data = self.sock.recv(8192)
+            if not data:
+                raise socket.error("No data from socket")
+            buf += data
+
+    @staticmethod
+    def _unpack_reply(req, text_output):
         # Unpack reply (remove root tag, i.e.: first and last lines).
         req = b'\n'.join(req.strip().rsplit(b'\n')[1:-1])
 
@@ -131,6 +182,57 @@ class Rpc(object):
         else:
             return ElementTree.fromstring(req)
 
+    def call_stream(self, request):
+        """
+        Do an RPC call as call(), but return the raw reply as a file-like
+        stream suitable for ElementTree.iterparse(), instead of reading
+        and parsing the whole reply at once. Useful for large replies
+        such as '<get_results/>', where building the full tree would
+        double memory and walk it twice. The stream must be consumed
+        before any other call on this connection.
+        """
+        self.send_request(request)
+        return _ReplyStream(self)
+
+    def call(self, request, text_output=None):
+        """
+        Do an RPC call. Pack and send the XML request and return the
+        unpacked reply. request can be either plain XML text or a
+        xml.etree.ElementTree.Element object. Return ElementTree.Element
+        or XML text according to text_output flag.
+        Will auto-connect if not connected.
+        """
+        if text_output is None:
+            text_output = self.text_output
+
+        self.send_request(request)
+        return self._unpack_reply(self._recv_reply(), text_output)
+
+    def call_batch(self, requests, text_output=None):
+        """
+        Pipeline several RPC calls: send every request in a single socket
+        write, then read the replies back-to-back. Saves one network
+        round-trip per extra request, which dominates poll latency on
+        remote hosts. Return the list of unpacked replies, in request
+        order.
+        """
+        if text_output is None:
+            text_output = self.text_output
+
+        if not self.sock:
+            self.connect(*self.sockargs)
+
+        payload = b"".join(self._pack_request(r) for r in requests)
+        try:
+            self.sock.sendall(payload)
+        except (socket.error, socket.herror, socket.gaierror, socket.timeout):
+            raise
+
+        return [
+            self._unpack_reply(self._recv_reply(), text_output)
+            for _ in requests
+        ]
+
 
 if __name__ == "__main__":
     # Example.